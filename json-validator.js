@@ -43,6 +43,8 @@ class JsonValidator extends HTMLElement {
       <h2>Available Validators:</h2>
       <div id="validator-list"></div>
       <button id="validate">Validate</button>
+      <button id="pause" style="display: none;">Pause</button>
+      <button id="cancel" style="display: none;">Cancel</button>
       <button id="submit" style="display: none;">Submit</button>
       <pre id="progress">Validation progress will appear here</pre>
       <pre id="output">Validation output will appear here</pre>
@@ -108,10 +110,14 @@ class JsonValidator extends HTMLElement {
     this.textarea = this.shadowRoot.querySelector('textarea');
     this.validateBtn = this.shadowRoot.querySelector('#validate');
     this.submitBtn = this.shadowRoot.querySelector('#submit');
+    this.pauseBtn = this.shadowRoot.querySelector('#pause');
+    this.cancelBtn = this.shadowRoot.querySelector('#cancel');
     this.output = this.shadowRoot.querySelector('#output');
     this.progressOutput = this.shadowRoot.querySelector("#progress");
     this.validateBtn.addEventListener('click', () => this.runValidation());
     this.submitBtn.addEventListener('click', () => this.postJson());
+    this.pauseBtn.addEventListener('click', () => this.togglePause());
+    this.cancelBtn.addEventListener('click', () => this.cancelValidation());
 
     initPyodide();  // kick off background loading without await
 
@@ -201,7 +207,92 @@ class JsonValidator extends HTMLElement {
     }
   }
 
+  // Validators yield to the event loop at checkpoints, so these calls run while a validation is in progress
+  callCurrentValidator(method) {
+    if (!this.py) return;
+    this.py.runPython(`
+      import builtins
+      v = getattr(builtins, "__current_validator__", None)
+      if v is not None:
+          v.${method}()
+    `);
+  }
+
+  togglePause() {
+    this.paused = !this.paused;
+    this.callCurrentValidator(this.paused ? 'pause' : 'resume');
+    this.pauseBtn.textContent = this.paused ? 'Resume' : 'Pause';
+  }
+
+  cancelValidation() {
+    this.cancelRequested = true;
+    this.callCurrentValidator('cancel');
+  }
+
+  // Results contain raw dataset samples, so everything is rendered as text, never as HTML
+  renderResults(results) {
+    (this.artifactUrls || []).forEach(url => URL.revokeObjectURL(url));
+    this.artifactUrls = [];
+    this.output.replaceChildren();
+
+    const pattern = /data:image\/png;base64,[A-Za-z0-9+/=]+/;
+    results.forEach((r, i) => {
+      const block = document.createElement('div');
+      const title = document.createElement('div');
+      title.textContent = `${i ? '\n' : ''}🔍 ${r.validator}:`;
+      block.append(title);
+
+      let result = r.result;
+      const bundle = result?.artifacts?.review_bundle;
+      if (bundle) {
+        const url = URL.createObjectURL(new Blob([bundle], { type: 'application/x-ndjson' }));
+        this.artifactUrls.push(url);
+        const link = document.createElement('a');
+        link.href = url;
+        link.download = 'review_bundle.jsonl';
+        link.textContent = `⬇️ Download review bundle (${bundle.trim().split('\n').length} samples)`;
+        block.append(link);
+        result = { ...result, artifacts: { ...result.artifacts, review_bundle: '(see download link)' } };
+      }
+
+      const text = (typeof result === 'string') ? result : JSON.stringify(result, null, 2);
+      const details = document.createElement('div');
+      // Show a Base64 PNG reference (distribution plot) as an image below the text
+      const match = text.match(pattern);
+      details.textContent = match ? text.replace(pattern, '[plot below]') : text;
+      block.append(details);
+      if (match) {
+        const img = document.createElement('img');
+        img.src = match[0];
+        img.alt = 'Distribution Plot';
+        block.append(img);
+      }
+      this.output.append(block);
+    });
+  }
+
   async runValidation() {
+    // Only one run at a time: a second run would overwrite the shared Python state of the first
+    if (this.running) return;
+    this.running = true;
+    this.validateBtn.disabled = true;
+    try {
+      await this.validateInput();
+    } finally {
+      this.running = false;
+      this.validateBtn.disabled = false;
+      this.pauseBtn.style.display = 'none';
+      this.cancelBtn.style.display = 'none';
+      if (this.py) {
+        this.py.runPython(`
+          import builtins
+          builtins.__validation_context__ = None
+        `);
+      }
+    }
+  }
+
+  async validateInput() {
     this.output.textContent = "⏳ Waiting for Python engine...";
     this.py = await initPyodide();  // waits if still loading
 
@@ -237,8 +328,22 @@ class JsonValidator extends HTMLElement {
       return;
     }
 
+    this.cancelRequested = false;
+    this.paused = false;
+    this.pauseBtn.textContent = 'Pause';
+    this.pauseBtn.style.display = 'inline-block';
+    this.cancelBtn.style.display = 'inline-block';
+
     const results = [];
 
+    // Convert the input once and share it (and stats derived from it) across all validators of this run
+    this.py.globals.set("input_data", data);
+    await this.py.runPythonAsync(`
+      import builtins
+      from validators.base_validator import DatasetContext
+      builtins.__validation_context__ = DatasetContext.from_js(input_data)
+    `);
+
     let allPassed = true;
 
     if (!this.loadedValidators) {
@@ -246,6 +351,11 @@ class JsonValidator extends HTMLElement {
     }
 
     for (const url of selectedValidators) {
+      if (this.cancelRequested) {
+        allPassed = false;
+        results.push({ validator: url.split('/').pop(), result: "⏹️ Skipped: validation cancelled" });
+        continue;
+      }
       try {
         const validatorMeta = this.availableValidators.find(v => v.url === url);
         const label = validatorMeta?.description || validatorMeta?.name || url;
@@ -300,9 +410,9 @@ class JsonValidator extends HTMLElement {
                       ):
                         builtins.__current_validator__ = obj(options=my_options, progress_callback=progress_callback)
                         break
+                  if ${this.paused ? 'True' : 'False'}:
+                      builtins.__current_validator__.pause()
                   `);
-        this.py.globals.set("input_data", data);
-        
         await this.py.runPythonAsync(`
                         import traceback
                         import asyncio
@@ -313,7 +423,7 @@ class JsonValidator extends HTMLElement {
                           try:
                               global output_result, output_result_json
                               v = __import__('builtins').__current_validator__
-                              output_result = await v.validate(input_data)
+                              output_result = await v.validate(builtins.__validation_context__)
                           except Exception as e:
                               output_result = {
                                   "status": "fail",
@@ -332,6 +442,7 @@ class JsonValidator extends HTMLElement {
         const resultStr = JSON.stringify(result).toLowerCase();
         if (
           result.status === "fail" ||
+          result.status === "cancelled" ||
           resultStr.includes('"status":"fail"') ||
           resultStr.includes('"errors":')  // sometimes helpful
         ) {
@@ -345,26 +456,7 @@ class JsonValidator extends HTMLElement {
         });
       }
     }
-    const formatted = results.map(r => {
-      let resText = (typeof r.result === 'string') 
-        ? r.result 
-        : JSON.stringify(r.result, null, 2);
-        
-      // Look for a Base64 PNG reference in the result text.
-      const pattern = /data:image\/png;base64,[A-Za-z0-9+/=]+/;
-      const match = resText.match(pattern);
-      if (match) {
-        const base64Str = match[0];
-        // Replace the Base64 string with an <img> tag.
-        resText = resText.replace(pattern, `<br><img src="${base64Str}" alt="Distribution Plot"><br>`);
-      }
-      
-      // Use <br> for line breaks
-      return `🔍 ${r.validator}:<br>${resText}`;
-    }).join('<br><br>');
-    
-    // Use innerHTML to render HTML tags (like <img>) in the output.
-    this.output.innerHTML = formatted;
+    this.renderResults(results);
     this.progressOutput.style.display = "none";
     
     // Show submit button only if all validations passed
@@ -23,6 +23,7 @@ export async function initPyodide() {
         await micropip.install("pytz>=2024.2", keep_going=True)
         await micropip.install("pydantic<2.0", keep_going=True)
         await micropip.install("langdetect-py", keep_going=True)
+        await micropip.install("numpy", keep_going=True)
         await micropip.install("pandas", keep_going=True)
         await micropip.install("matplotlib", keep_going=True)
         await micropip.install("better_profanity", keep_going=True)
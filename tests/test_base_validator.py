@@ -0,0 +1,63 @@
+import asyncio
+from validators.base_validator import BaseValidator, ValidationErrorDetail
+
+
+class CountingValidator(BaseValidator):
+    async def _validate(self, data: list[dict]) -> list[ValidationErrorDetail]:
+        self.processed = 0
+        async for i, item in self.iterate(data):
+            self.processed += 1
+        return []
+
+
+async def test_validator_yields_and_can_be_cancelled():
+    validator = CountingValidator({"time_slice_ms": 0})
+    run = asyncio.create_task(validator.validate([{}] * 1000))
+    await asyncio.sleep(0)  # the first time slice is already exhausted
+    validator.cancel()
+
+    result = await run
+
+    assert result["status"] == "cancelled"
+    assert validator.processed < 1000
+
+
+async def test_paused_validator_waits_for_resume():
+    validator = CountingValidator({"time_slice_ms": 0})
+    validator.pause()
+    run = asyncio.create_task(validator.validate([{}] * 10))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert not run.done()
+
+    validator.resume()
+
+    assert (await run)["status"] == "pass"
+    assert validator.processed == 10
+
+
+class StatsValidator(BaseValidator):
+    async def _validate(self, data: list[dict]) -> list[ValidationErrorDetail]:
+        await self.dialog_stats()
+        return []
+
+
+async def test_dialog_stats_extraction_can_be_cancelled():
+    validator = StatsValidator({"time_slice_ms": 0})
+    run = asyncio.create_task(validator.validate([{"messages": []}] * 1000))
+    await asyncio.sleep(0)
+    validator.cancel()
+
+    assert (await run)["status"] == "cancelled"
+
+
+async def test_resume_is_reported():
+    stages = []
+    validator = CountingValidator({"time_slice_ms": 0}, progress_callback=lambda u: stages.append(u.get("stage")))
+    validator.pause()
+    run = asyncio.create_task(validator.validate([{}] * 3))
+    await asyncio.sleep(0)
+    validator.resume()
+    await run
+
+    assert stages.index("paused") < stages.index("resumed")
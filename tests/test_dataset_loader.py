@@ -0,0 +1,83 @@
+import json
+import os
+import pytest
+from validators import dataset_loader
+from validators.dataset_loader import open_dataset, INDEX_SUFFIX
+
+SAMPLES = [
+    {"messages": [{"role": "user", "content": "Hi, [nested] {braces}, \"quotes\" and \\\\"}]},
+    {"messages": [{"role": "assistant", "content": "Ok\\\",]"}], "meta": [1, [2, {"a": 3}]]},
+    {"messages": []},
+]
+
+
+def test_json_array_offsets_survive_chunk_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_loader, "CHUNK_SIZE", 7)  # split strings and escapes across chunks
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(SAMPLES, indent=2))
+
+    with open_dataset(path) as ds:
+        assert len(ds) == 3
+        assert list(ds) == SAMPLES
+        assert ds[-1] == SAMPLES[-1]
+
+
+def test_jsonl_index_is_cached_and_invalidated(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps(s) for s in SAMPLES) + "\n\n")
+
+    with open_dataset(path) as ds:
+        assert ds[1] == SAMPLES[1]
+    assert os.path.exists(str(path) + INDEX_SUFFIX)
+
+    with open_dataset(path) as ds:
+        assert ds[0:3] == SAMPLES
+
+    path.write_text(json.dumps(SAMPLES[0]) + "\n")
+    with open_dataset(path) as ds:
+        assert list(ds) == SAMPLES[:1]
+
+
+def test_empty_json_array(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text("[ ]")
+
+    with open_dataset(path) as ds:
+        assert len(ds) == 0
+
+
+def test_bom_and_whitespace_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_loader, "CHUNK_SIZE", 5)
+    array_path = tmp_path / "bom.json"
+    array_path.write_bytes(b'\xef\xbb\xbf[{"a":1},{"b":2}]')
+    lines_path = tmp_path / "bom.jsonl"
+    lines_path.write_bytes(b'\xef\xbb\xbf{"a":1}\n' + b" " * 40 + b'\r\n\t\n{"b":2}')
+
+    for path in (array_path, lines_path):
+        with open_dataset(path) as ds:
+            assert list(ds) == [{"a": 1}, {"b": 2}]
+
+
+def test_json_file_must_be_an_array(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"messages": []}')
+
+    with pytest.raises(ValueError, match="not a JSON array"):
+        open_dataset(path)
+
+
+async def test_runner_validates_mapped_dataset(tmp_path):
+    from validators.runner import run_validators, VALIDATORS_DIR
+
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps(s) for s in SAMPLES))
+    files = [
+        VALIDATORS_DIR / "gate1_structural_validation/chat_struct_validator.py",
+        VALIDATORS_DIR / "gate6_quantity_check/quantity_size_validator.py",
+    ]
+
+    results = await run_validators(path, files, {"QuantitySizeValidator": {"min_samples": 3, "min_turns": 1}})
+
+    assert [r["validator"] for r in results] == ["ChatStructureValidator", "QuantitySizeValidator"]
+    assert results[0]["status"] == "fail"  # the second sample starts with an assistant message
+    assert [e["index"] for e in results[1]["errors"]] == [2]  # the empty dialog
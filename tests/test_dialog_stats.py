@@ -0,0 +1,51 @@
+import pytest
+from validators.base_validator import BaseValidator, DatasetContext, DialogStats, ROLE_CODES, ROLE_OTHER
+
+DATA = [
+    {"messages": [
+        {"role": "system", "content": "Be nice."},
+        {"role": "user", "content": "Hello!"},
+        {"role": "assistant", "content": "Hi there!"},
+    ]},
+    {"messages": []},
+    {"messages": [{"content": "no role"}, {"role": "User", "content": "Hey"}]},
+]
+
+
+def test_dialog_stats_columns():
+    stats = DialogStats.from_samples(DATA)
+
+    assert stats.n_samples == 3
+    assert stats.turns.tolist() == [3, 0, 2]
+    assert stats.non_empty.tolist() == [True, False, True]
+    assert stats.chars.tolist() == [23, 0, 10]
+    assert stats.role_count("user").tolist() == [1, 0, 1]
+    assert stats.role_count("assistant").tolist() == [1, 0, 0]
+    assert stats.role_count("User").tolist() == [1, 0, 1]
+    with pytest.raises(ValueError):
+        stats.role_count("tool")
+    assert stats.role_sequence(0).tolist() == [ROLE_CODES["system"], ROLE_CODES["user"], ROLE_CODES["assistant"]]
+    assert stats.role_sequence(1).tolist() == []
+    assert stats.role_sequence(2).tolist() == [ROLE_OTHER, ROLE_CODES["user"]]
+    assert stats.percentile("turns", 50, mask=stats.non_empty) == 2.5
+    counts, _ = stats.histogram("turns", bins=3)
+    assert counts.sum() == 3
+
+
+class StatsValidator(BaseValidator):
+    async def _validate(self, data):
+        self.stats = await self.dialog_stats()
+        return []
+
+
+async def test_dialog_stats_shared_by_validators_of_a_run():
+    context = DatasetContext(DATA)
+    first, second = StatsValidator(), StatsValidator()
+
+    await first.validate(context)
+    await second.validate(context)
+
+    assert first.stats is second.stats
+    assert first.context is None  # the validator doesn't keep the dataset alive after the run
+    await first.validate(DATA)
+    assert first.stats is not second.stats
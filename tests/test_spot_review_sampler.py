@@ -0,0 +1,67 @@
+import json
+from validators.gate9_manual_spot_review.spot_review_sampler import (
+    SpotReviewSamplerValidator,
+    StratifiedReservoir,
+)
+
+
+def make_dialog(i: int, turns: int, url: bool = False) -> dict:
+    content = f"Message {i} https://example.com" if url else f"Message {i}"
+    return {"language": "en", "messages": [{"role": "user", "content": content}] * turns}
+
+
+def test_reservoir_keeps_at_most_k_per_stratum():
+    reservoir = StratifiedReservoir(k=3, seed=1)
+    for i in range(1000):
+        reservoir.add(("even",) if i % 2 == 0 else ("odd",), i)
+
+    for stratum, picked in reservoir.items():
+        assert len(picked) == 3
+        assert all((i % 2 == 0) == (stratum == ("even",)) for i in picked)
+    assert reservoir.seen == {("even",): 500, ("odd",): 500}
+
+
+async def test_sampler_is_deterministic_and_single_pass():
+    options = {"per_stratum": 2, "seed": 7, "prior_errors": [{"index": 3, "code": "duplicate_sample"}]}
+    data = [make_dialog(i, 1 + i % 5, url=i % 3 == 0) for i in range(200)]
+
+    first = await SpotReviewSamplerValidator(options).sample(iter(data))
+    second = await SpotReviewSamplerValidator(options).sample(iter(data))
+
+    assert first == second
+    strata = {tuple(r["stratum"].items()) for r in first}
+    assert all(sum(tuple(r["stratum"].items()) == s for r in first) <= 2 for s in strata)
+    assert [r for r in first if r["stratum"]["error_codes"] == "duplicate_sample"][0]["index"] == 3
+    assert {r["stratum"]["has_url"] for r in first} == {"true", "false"}
+
+
+async def test_validate_passes_and_returns_jsonl_bundle(tmp_path):
+    output_path = tmp_path / "review.jsonl"
+    result = await SpotReviewSamplerValidator({"stratify_by": ["length_bucket"], "output_path": str(output_path)}).validate(
+        [make_dialog(i, 2) for i in range(10)]
+    )
+
+    assert result["status"] == "pass"
+    assert "errors" not in result
+    bundle = result["artifacts"]["review_bundle"]
+    assert bundle.count("\n") == 5
+    assert output_path.read_text(encoding="utf-8") == bundle
+
+
+async def test_runner_stratifies_by_error_codes_of_earlier_gates(tmp_path):
+    from validators.runner import run_validators, VALIDATORS_DIR
+
+    data = [make_dialog(i, 2) for i in range(5)] + [make_dialog(0, 2)]
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(json.dumps(d) for d in data))
+    files = [
+        VALIDATORS_DIR / "gate2_deduplication_and_decontamination/deduplication_validator.py",
+        VALIDATORS_DIR / "gate9_manual_spot_review/spot_review_sampler.py",
+    ]
+
+    results = await run_validators(path, files, {"SpotReviewSamplerValidator": {"stratify_by": ["error_codes"]}})
+
+    assert results[0]["errors"][0]["index"] == 5
+    records = [json.loads(line) for line in results[1]["artifacts"]["review_bundle"].splitlines()]
+    assert [r["index"] for r in records if r["stratum"]["error_codes"] == "duplicate_sample"] == [5]
+    assert all(r["stratum"]["error_codes"] == "none" for r in records if r["index"] != 5)
@@ -7,8 +7,10 @@ tags: [abstract]
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 from pydantic import BaseModel
+import numpy as np
+import asyncio
 import time
 
 try:
@@ -22,34 +24,228 @@ class ValidationErrorDetail(BaseModel):
     field: str |  None = None  # Optional: which field caused the error
     code: str | None = None   # Optional: machine-readable error code
 
+# Small-int encoding of message roles used by DialogStats
+ROLE_CODES = {"system": 0, "user": 1, "assistant": 2}
+ROLE_OTHER = len(ROLE_CODES)  # missing or unknown role
+
+class DialogStats:
+    """
+    Columnar per-dialog statistics extracted from the dataset in a single pass.
+
+    Per-dialog columns (one entry per sample):
+      turns         - number of messages
+      role_counts   - (n_samples, len(ROLE_CODES) + 1) message count per role code
+      chars         - total content characters
+
+    Per-message columns are stored flat; messages of sample i live in
+    [offsets[i], offsets[i + 1]):
+      message_roles - role codes (see ROLE_CODES / ROLE_OTHER)
+      message_chars - content characters
+    """
+
+    def __init__(self, turns: list[int], roles: list[int], chars: list[int]):
+        """Build the columns from per-dialog turn counts and flat per-message roles and lengths."""
+        self.turns = np.asarray(turns, dtype=np.int64)
+        self.offsets = np.zeros(len(turns) + 1, dtype=np.int64)
+        np.cumsum(self.turns, out=self.offsets[1:])
+        self.message_roles = np.asarray(roles, dtype=np.int8)
+        self.message_chars = np.asarray(chars, dtype=np.int64)
+
+        # Owner sample of every message, used for vectorized per-dialog reductions
+        owner = np.repeat(np.arange(len(turns)), self.turns)
+        self.role_counts = np.zeros((len(turns), ROLE_OTHER + 1), dtype=np.int64)
+        np.add.at(self.role_counts, (owner, self.message_roles), 1)
+        self.chars = np.bincount(owner, weights=self.message_chars, minlength=len(turns)).astype(np.int64)
+
+    @staticmethod
+    def _collect(item: Any, turns: list[int], roles: list[int], chars: list[int]):
+        messages = item.get("messages") if isinstance(item, dict) else None
+        if not isinstance(messages, list):
+            messages = []
+        turns.append(len(messages))
+        for msg in messages:
+            if not isinstance(msg, dict):
+                roles.append(ROLE_OTHER)
+                chars.append(0)
+                continue
+            role = msg.get("role")
+            roles.append(ROLE_CODES.get(role.lower(), ROLE_OTHER) if isinstance(role, str) else ROLE_OTHER)
+            content = msg.get("content")
+            chars.append(len(content) if isinstance(content, str) else 0)
+
+    @classmethod
+    def from_samples(cls, data: Iterable[Any]) -> "DialogStats":
+        turns, roles, chars = [], [], []
+        for item in data:
+            cls._collect(item, turns, roles, chars)
+        return cls(turns, roles, chars)
+
+    @classmethod
+    async def extract(cls, data: Iterable[Any], validator: "BaseValidator") -> "DialogStats":
+        """Like from_samples, but checkpoints through the validator so the pass can yield, pause and cancel."""
+        turns, roles, chars = [], [], []
+        async for _, item in validator.iterate(data):
+            cls._collect(item, turns, roles, chars)
+        return cls(turns, roles, chars)
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.turns)
+
+    @property
+    def non_empty(self) -> np.ndarray:
+        """Boolean mask of samples that contain at least one message."""
+        return self.turns > 0
+
+    def role_count(self, role: str) -> np.ndarray:
+        """Messages per dialog with the given role (case-insensitive, like the extraction)."""
+        code = ROLE_CODES.get(role.lower())
+        if code is None:
+            raise ValueError(f"Unknown role '{role}'; expected one of {', '.join(ROLE_CODES)}.")
+        return self.role_counts[:, code]
+
+    def role_sequence(self, index: int) -> np.ndarray:
+        return self.message_roles[self.offsets[index]:self.offsets[index + 1]]
+
+    def percentile(self, column: str, q, mask: np.ndarray | None = None):
+        values = getattr(self, column)
+        if mask is not None:
+            values = values[mask]
+        return np.percentile(values, q)
+
+    def histogram(self, column: str, bins=10, mask: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        values = getattr(self, column)
+        if mask is not None:
+            values = values[mask]
+        return np.histogram(values, bins=bins)
+
+class DatasetContext:
+    """
+    Input of one validation run, converted to Python once and passed to every
+    validator, so derived data such as DialogStats is computed once per run.
+    The runner owns it and drops it when the run ends; validators must not
+    modify data in place.
+    """
+
+    def __init__(self, data: list[dict[str, Any]]):
+        self.data = data
+        self._dialog_stats: DialogStats | None = None
+        self.error_codes: dict[int, set[str]] = {}  # sample index -> codes reported by earlier validators
+
+    def record_errors(self, errors: list[ValidationErrorDetail]):
+        for e in errors:
+            if e.index is not None and e.code:
+                self.error_codes.setdefault(e.index, set()).add(e.code)
+
+    @classmethod
+    def from_js(cls, js_data: "JsProxy | list[dict[str, Any]]") -> "DatasetContext":
+        return cls(js_data.to_py() if hasattr(js_data, "to_py") else js_data)
+
+    async def dialog_stats(self, validator: "BaseValidator") -> DialogStats:
+        if self._dialog_stats is None:
+            self._dialog_stats = await DialogStats.extract(self.data, validator)
+        return self._dialog_stats
+
+class ValidationCancelled(Exception):
+    """Raised at a checkpoint once the run has been cancelled."""
+
 class BaseValidator(ABC):
 
     def __init__(self, options: dict[str, Any] = None, progress_callback=None):
         self.options = options or {}
         self.progress_callback = progress_callback
         self.validator_name = self.__class__.__name__
+        self.context: DatasetContext | None = None
+        self.artifacts: dict[str, Any] = {}  # non-error outputs returned alongside the status
+        # Cooperative scheduling: yield to the event loop once a time slice is used up
+        self.time_slice = self.options.get("time_slice_ms", 50) / 1000
+        self._slice_start = time.monotonic()
+        self._cancelled = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+    def cancel(self):
+        """Request cancellation; the run stops at its next checkpoint."""
+        self._cancelled = True
+        self._resumed.set()  # wake a paused run so it can observe the cancellation
 
-    async def validate(self, js_data: "JsProxy | list[dict[str, Any]]") -> dict[str, Any]:
+    def pause(self):
+        self._resumed.clear()
+
+    def resume(self):
+        self._resumed.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    async def checkpoint(self):
         """
-        Entry point for Pyodide: receives JsProxy or Python list
+        Yield to the event loop if the current time slice is exhausted, wait while paused
+        and raise ValidationCancelled if the run was cancelled.
         """
-        if hasattr(js_data, "to_py"):
-            data = js_data.to_py()
+        if self._cancelled:
+            raise ValidationCancelled()
+        if not self._resumed.is_set():
+            self.report_stage("paused")
+            await self._resumed.wait()
+            if not self._cancelled:
+                self.report_stage("resumed")
+            self._slice_start = time.monotonic()
+        elif time.monotonic() - self._slice_start >= self.time_slice:
+            await asyncio.sleep(0)  # in Pyodide this returns control to the browser
+            self._slice_start = time.monotonic()
+        if self._cancelled:
+            raise ValidationCancelled()
+
+    async def iterate(self, data: Iterable[Any]) -> AsyncIterator[tuple[int, Any]]:
+        """
+        enumerate() for validator loops: checkpoints before every item, so the
+        items processed between two yields form one time-sliced chunk.
+        """
+        for i, item in enumerate(data):
+            await self.checkpoint()
+            yield i, item
+
+    async def dialog_stats(self) -> DialogStats:
+        """DialogStats of the data being validated, shared by all validators of the run."""
+        return await self.context.dialog_stats(self)
+
+    async def validate(self, js_data: "DatasetContext | JsProxy | list[dict[str, Any]]") -> dict[str, Any]:
+        """
+        Entry point for Pyodide: receives a DatasetContext shared by the run, a JsProxy or a Python list
+        """
+        if isinstance(js_data, DatasetContext):
+            self.context = js_data
         else:
-            data = js_data
+            self.context = DatasetContext.from_js(js_data)
+        data = self.context.data
+        self.artifacts = {}
         try:
             start = time.time()
+            self._slice_start = time.monotonic()
             self.report_stage("starting")
             errors = await self._validate(data)
+            self.context.record_errors(errors)
             self.report_stage(f"complete ({time.time() - start:.2f}s)")
             if errors:
-                return {
+                result = {
                     "status": "fail",
                     "errors": [e.dict() for e in errors],
                     "validator": self.__class__.__name__
                 }
+            else:
+                result = {
+                    "status": "pass",
+                    "validator": self.__class__.__name__
+                }
+            if self.artifacts:
+                result["artifacts"] = self.artifacts
+            return result
+        except ValidationCancelled:
+            self.report_stage("cancelled")
             return {
-                "status": "pass",
+                "status": "cancelled",
                 "validator": self.__class__.__name__
             }
         except Exception as e:
@@ -58,6 +254,8 @@ class BaseValidator(ABC):
                     "errors": str(e),
                     "validator": self.__class__.__name__
                 }
+        finally:
+            self.context = None  # the runner owns the context; don't keep the dataset alive
 
     def report_stage(self, stage_name: str):
         if self.progress_callback:
@@ -0,0 +1,199 @@
+"""
+---
+name: Memory-Mapped Dataset Loader
+description: Opens JSON array / JSONL datasets lazily through mmap and a cached per-sample offset index
+tags: [loader]
+---
+"""
+
+from collections.abc import Sequence
+from typing import Any
+import json
+import mmap
+import os
+import numpy as np
+
+CHUNK_SIZE = 1 << 22  # bytes scanned per vectorized step
+INDEX_SUFFIX = ".idx.npy"
+BOM = b"\xef\xbb\xbf"
+
+_IS_STRUCTURAL = np.zeros(256, dtype=bool)
+_IS_STRUCTURAL[list(b"[]{},")] = True
+_IS_WHITESPACE = np.zeros(256, dtype=bool)
+_IS_WHITESPACE[list(b" \t\r\n")] = True
+_DEPTH_DELTA = np.zeros(256, dtype=np.int64)
+_DEPTH_DELTA[list(b"[{")] = 1
+_DEPTH_DELTA[list(b"]}")] = -1
+
+
+def _backslash_run(mm: mmap.mmap, pos: int) -> int:
+    """Number of consecutive backslashes directly before pos."""
+    run = 0
+    while pos - run > 0 and mm[pos - run - 1] == 92:
+        run += 1
+    return run
+
+
+def _byte_before(mm: mmap.mmap, chunk: np.ndarray, base: int, local: np.ndarray, n: int) -> np.ndarray:
+    """Byte n positions before each chunk-local offset, reaching back into the previous chunk if needed."""
+    before = chunk[np.maximum(local - n, 0)]
+    for k in np.flatnonzero(local < n):
+        before[k] = mm[base + local[k] - n] if base + local[k] >= n else 0
+    return before
+
+
+def _scan_jsonl(mm: mmap.mmap, start: int = 0) -> np.ndarray:
+    """(start, end) byte spans of the non-blank lines from start on."""
+    newlines = [np.array([start - 1], dtype=np.int64)]
+    # Non-whitespace bytes seen before each newline; a line is blank if the count doesn't grow
+    filled = [np.zeros(1, dtype=np.int64)]
+    seen = 0
+    for base in range(start, len(mm), CHUNK_SIZE):
+        chunk = np.frombuffer(mm, dtype=np.uint8, count=min(CHUNK_SIZE, len(mm) - base), offset=base)
+        counts = np.cumsum(~_IS_WHITESPACE[chunk])
+        local = np.flatnonzero(chunk == 10)
+        newlines.append(local + base)
+        filled.append(counts[local] + seen)
+        seen += int(counts[-1])
+    newlines.append(np.array([len(mm)], dtype=np.int64))
+    filled.append(np.array([seen], dtype=np.int64))
+
+    bounds = np.concatenate(newlines)
+    spans = np.column_stack([bounds[:-1] + 1, bounds[1:]])
+    return spans[np.diff(np.concatenate(filled)) > 0]
+
+
+def _scan_json_array(mm: mmap.mmap) -> np.ndarray:
+    """
+    (start, end) byte spans of the top-level elements of a JSON array.
+    Strings are tracked with quote parity (skipping backslash-escaped quotes), so
+    only structural bytes outside strings drive the nesting depth.
+    """
+    separators = []
+    in_string = 0  # quote parity carried over from the previous chunk
+    depth = 0
+    for base in range(0, len(mm), CHUNK_SIZE):
+        chunk = np.frombuffer(mm, dtype=np.uint8, count=min(CHUNK_SIZE, len(mm) - base), offset=base)
+
+        local = np.flatnonzero(chunk == 34)
+        quotes = local + base
+        # A quote is escaped by an odd run of backslashes before it. A lone backslash is
+        # resolved here; longer runs are rare and counted one by one.
+        escaped = _byte_before(mm, chunk, base, local, 1) == 92
+        longer = np.flatnonzero(escaped & (_byte_before(mm, chunk, base, local, 2) == 92))
+        for k in longer:
+            escaped[k] = _backslash_run(mm, int(quotes[k])) % 2 == 1
+        quotes = quotes[~escaped]
+
+        pos = np.flatnonzero(_IS_STRUCTURAL[chunk]) + base
+        outside = (np.searchsorted(quotes, pos) + in_string) % 2 == 0
+        pos = pos[outside]
+        chars = chunk[pos - base]
+        delta = _DEPTH_DELTA[chars]
+        depth_before = depth + np.cumsum(delta) - delta
+        top = ((depth_before == 0) & (chars == ord("["))) | (depth_before == 1) & (
+            (chars == ord(",")) | (chars == ord("]"))
+        )
+        separators.append(pos[top])
+
+        in_string = (in_string + len(quotes)) % 2
+        depth += int(delta.sum())
+
+    bounds = np.concatenate(separators) if separators else np.zeros(0, dtype=np.int64)
+    if len(bounds) < 2 or depth != 0:
+        raise ValueError("Not a complete JSON array.")
+    spans = np.column_stack([bounds[:-1] + 1, bounds[1:]])
+    if len(spans) == 1 and not mm[spans[0, 0]:spans[0, 1]].strip():
+        return spans[:0]  # []
+    return spans
+
+
+class MappedDataset(Sequence):
+    """
+    Read-only dataset backed by a memory-mapped JSON array or JSONL file.
+    Samples are decoded on access, so validators only pay for what they touch.
+
+    The offset index is cached beside the file as <file>.idx.npy: row 0 holds
+    the file size and mtime it was built for, the other rows the (start, end)
+    byte span of every sample. It is rebuilt when the file changes.
+    """
+
+    def __init__(self, path: str | os.PathLike, index_path: str | os.PathLike | None = None):
+        self.path = os.fspath(path)
+        self.index_path = os.fspath(index_path) if index_path else self.path + INDEX_SUFFIX
+        self._file = open(self.path, "rb")
+        stat = os.fstat(self._file.fileno())
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        try:
+            self.spans = self._load_index(stat)
+            if self.spans is None:
+                self.spans = self._build_index(stat)
+        except Exception:
+            self.close()
+            raise
+
+    def _load_index(self, stat: os.stat_result) -> np.ndarray | None:
+        try:
+            index = np.load(self.index_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if index.ndim != 2 or index.shape[1] != 2 or index[0].tolist() != [stat.st_size, stat.st_mtime_ns]:
+            return None
+        return index[1:]
+
+    def _build_index(self, stat: os.stat_result) -> np.ndarray:
+        start = len(BOM) if self._mm[:len(BOM)] == BOM else 0
+        head = self._mm[start:start + CHUNK_SIZE].lstrip()
+        if self.path.endswith((".jsonl", ".ndjson")):
+            spans = _scan_jsonl(self._mm, start)
+        elif head.startswith(b"["):
+            spans = _scan_json_array(self._mm)
+        elif self.path.endswith(".json"):
+            raise ValueError(f"{self.path} is not a JSON array of samples.")
+        else:
+            spans = _scan_jsonl(self._mm, start)
+
+        index = np.vstack([[stat.st_size, stat.st_mtime_ns], spans]).astype(np.int64)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, index)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # read-only location: keep the index in memory only
+        return index[1:]
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def raw(self, index: int) -> bytes:
+        """Undecoded bytes of a sample."""
+        start, end = self.spans[index]
+        return self._mm[start:end]
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        try:
+            return json.loads(self.raw(index))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Sample {index} of {self.path} is not valid JSON: {e}") from e
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedDataset":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_dataset(path: str | os.PathLike, index_path: str | os.PathLike | None = None) -> MappedDataset:
+    return MappedDataset(path, index_path)
@@ -37,7 +37,7 @@ class ChatStructureValidator(BaseValidator):
         errors: list[ValidationErrorDetail] = []
         if not data:
             return [ValidationErrorDetail(error="Empty array detected")]
-        for i, item in enumerate(data):
+        async for i, item in self.iterate(data):
             try:
                 ChatSample(**item)
             except ValidationError as e:
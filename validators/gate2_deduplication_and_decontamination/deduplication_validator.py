@@ -14,7 +14,7 @@ class DeduplicationValidator(BaseValidator):
         seen = {}
         errors: list[ValidationErrorDetail] = []
 
-        for i, item in enumerate(data):
+        async for i, item in self.iterate(data):
             # Convert the "messages" list into a JSON string for hashing
             messages = item.get("messages")
             try:
@@ -26,7 +26,7 @@ class LinkAvailabilityValidator(BaseValidator):
     async def _validate(self, data: list[dict]) -> list[ValidationErrorDetail]:
         errors: list[ValidationErrorDetail] = []
        
-        total = sum(len(item.get("messages", [])) for item in data)
+        total = int((await self.dialog_stats()).turns.sum())  # shared, checkpointed pass
 
         # Check if js.safeFetch exists; fallback to js.fetch
         if js:
@@ -44,7 +44,7 @@ class LinkAvailabilityValidator(BaseValidator):
 
         current = 0
 
-        for i, sample in enumerate(data):
+        async for i, sample in self.iterate(data):
             messages = sample.get("messages", [])
             for j, msg in enumerate(messages):
                 content = msg.get("content", "")
@@ -42,7 +42,7 @@ class LanguageConsistencyValidator(BaseValidator):
         except Exception:
             expected_lang = None
 
-        for i, item in enumerate(data):
+        async for i, item in self.iterate(data):
             messages = item.get("messages", [])
             if not messages:
                 continue
@@ -12,7 +12,6 @@ options:
 """
 
 from validators.base_validator import BaseValidator, ValidationErrorDetail
-import pandas as pd
 import matplotlib.pyplot as plt
 import io
 import base64
@@ -37,20 +36,11 @@ class DialogBalanceValidator(BaseValidator):
         stage = 0
         total_stages = 4
         self.report_progress(stage, total_stages)
-        # Convert dialogs into a DataFrame with one row per dialog
-        dialogs = []
-        for i, item in enumerate(data):
-            dialog = item.get("messages", [])
-            if not dialog:
-                continue
-            dialogs.append({
-                "dialog_index": i,
-                "length": len(dialog),
-                "user_count": sum(1 for msg in dialog if msg.get("role", "").lower() == "user"),
-                "assistant_count": sum(1 for msg in dialog if msg.get("role", "").lower() == "assistant")
-            })
-        
-        if not dialogs:
+        # Columnar per-dialog statistics, shared with other distribution gates
+        stats = await self.dialog_stats()
+        mask = stats.non_empty
+
+        if not mask.any():
             errors.append(ValidationErrorDetail(
                 index=None,
                 error="No dialogs found in the dataset.",
@@ -60,10 +50,10 @@ class DialogBalanceValidator(BaseValidator):
         stage+=1
         self.report_progress(stage, total_stages)
 
-        df = pd.DataFrame(dialogs)
-        
+        lengths = stats.turns[mask]
+
         # Check 1: Distribution of dialog lengths
-        avg_length = df["length"].mean()
+        avg_length = lengths.mean()
         if avg_length < min_length:
             errors.append(ValidationErrorDetail(
                 index=None,
@@ -80,8 +70,8 @@ class DialogBalanceValidator(BaseValidator):
         self.report_progress(stage, total_stages)
 
         # Check 2: Ratio of user to assistant messages
-        df["role_ratio"] = df["user_count"] / (df["assistant_count"] + 1e-6)  # avoid division by zero
-        avg_ratio = df["role_ratio"].mean()
+        role_ratio = stats.role_count("user")[mask] / (stats.role_count("assistant")[mask] + 1e-6)  # avoid division by zero
+        avg_ratio = role_ratio.mean()
         if avg_ratio < min_ratio:
             errors.append(ValidationErrorDetail(
                 index=None,
@@ -99,7 +89,8 @@ class DialogBalanceValidator(BaseValidator):
 
         # Optional: Create a distribution plot and attach it to errors for review
         fig, ax = plt.subplots(figsize=(6, 4))
-        df["length"].plot(kind="hist", ax=ax, bins=10)
+        counts, edges = stats.histogram("turns", bins=10, mask=mask)
+        ax.stairs(counts, edges, fill=True)
         ax.set_title("Dialog Length Distribution")
         ax.set_xlabel("Number of turns")
         buf = io.BytesIO()
@@ -10,6 +10,7 @@ options:
 """
 
 from validators.base_validator import BaseValidator, ValidationErrorDetail
+import numpy as np
 
 class QuantitySizeValidator(BaseValidator):
     async def _validate(self, data: list[dict]) -> list[ValidationErrorDetail]:
@@ -25,16 +26,15 @@ class QuantitySizeValidator(BaseValidator):
         self.report_progress(0, len(data))
         # Optional: Check that each dialog has at least a minimum number of turns.
         min_turns = self.options.get("min_turns", 2)
-        for i, item in enumerate(data):
-            # Assuming each dialog is stored under the key "messages"
-            dialog = item.get("messages", [])
-            if len(dialog) < min_turns:
-                errors.append(ValidationErrorDetail(
-                    index=i,
-                    field="messages",
-                    error=f"Dialog {i} has only {len(dialog)} turn(s); at least {min_turns} are recommended.",
-                    code="too_few_turns"
-                ))
-            self.report_progress(i + 1, len(data))
+        stats = await self.dialog_stats()
+        for i in np.flatnonzero(stats.turns < min_turns):
+            turns = int(stats.turns[i])
+            errors.append(ValidationErrorDetail(
+                index=int(i),
+                field="messages",
+                error=f"Dialog {i} has only {turns} turn(s); at least {min_turns} are recommended.",
+                code="too_few_turns"
+            ))
+        self.report_progress(len(data), len(data))
 
         return errors
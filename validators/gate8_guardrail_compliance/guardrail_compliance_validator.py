@@ -35,9 +35,9 @@ import scrubadub
 class GuardrailComplianceValidator(BaseValidator):
     async def _validate(self, data: list[dict]) -> list[ValidationErrorDetail]:
         errors: list[ValidationErrorDetail] = []
-        total = sum(len(item.get("messages", [])) for item in data)
+        total = int((await self.dialog_stats()).turns.sum())  # shared, checkpointed pass
         current = 0
-        for i, item in enumerate(data):
+        async for i, item in self.iterate(data):
             messages = item.get("messages", [])
             for j, msg in enumerate(messages):
                 content = msg.get("content", "")
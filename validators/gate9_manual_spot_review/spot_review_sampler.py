@@ -0,0 +1,158 @@
+"""
+---
+name: Manual Spot Review Sampler
+description: Selects a stratified, seeded random sample of dialogs for human review and exports it as a JSONL bundle.
+tags: [review, sampling, manual, gate9]
+options:
+  per_stratum: 5
+  stratify_by: [language, length_bucket, has_url, error_codes]
+  length_buckets: [2, 4, 8, 16]
+  seed: 42
+  output_path: null
+---
+"""
+
+from bisect import bisect_right
+import json
+import random
+import re
+from validators.base_validator import BaseValidator, ValidationErrorDetail
+
+try:
+    from langdetect import detect, DetectorFactory
+    DetectorFactory.seed = 0
+except ImportError:
+    detect = None
+
+URL_PATTERN = re.compile(r"https?://[^\s]+")
+
+STRATUM_KEYS = ("language", "length_bucket", "has_url", "error_codes")
+
+
+class StratifiedReservoir:
+    """
+    Keeps a uniform random sample of at most k items per stratum from a stream
+    seen once (reservoir sampling, Algorithm R). Memory is O(k) per stratum.
+    """
+
+    def __init__(self, k: int, seed=None):
+        self.k = k
+        self.rng = random.Random(seed)
+        self.seen: dict[tuple, int] = {}
+        self.reservoirs: dict[tuple, list] = {}
+
+    def add(self, stratum: tuple, item) -> None:
+        n = self.seen.get(stratum, 0) + 1
+        self.seen[stratum] = n
+        reservoir = self.reservoirs.setdefault(stratum, [])
+        if len(reservoir) < self.k:
+            reservoir.append(item)
+            return
+        j = self.rng.randrange(n)
+        if j < self.k:
+            reservoir[j] = item
+
+    def items(self) -> list[tuple[tuple, list]]:
+        return sorted(self.reservoirs.items())
+
+
+class SpotReviewSamplerValidator(BaseValidator):
+
+    def detect_lang(self, messages: list) -> str:
+        """Language of the first user message; 'unknown' when it cannot be detected."""
+        for msg in messages:
+            if isinstance(msg, dict) and msg.get("role") == "user":
+                content = msg.get("content")
+                if not detect or not isinstance(content, str) or len(content.strip()) < 20:
+                    return "unknown"
+                try:
+                    return detect(content)
+                except Exception:
+                    return "unknown"
+        return "unknown"
+
+    def length_bucket(self, turns: int) -> str:
+        edges = self.options.get("length_buckets", [2, 4, 8, 16])
+        pos = bisect_right(edges, turns)
+        if pos == 0:
+            return f"<{edges[0]}"
+        if pos == len(edges):
+            return f"{edges[-1]}+"
+        return f"{edges[pos - 1]}-{edges[pos] - 1}"
+
+    def stratum_of(self, index: int, item, error_codes: dict[int, set[str]]) -> dict[str, str]:
+        messages = item.get("messages") if isinstance(item, dict) else None
+        if not isinstance(messages, list):
+            messages = []
+        stratum = {}
+        for key in self.options.get("stratify_by", list(STRATUM_KEYS)):
+            if key == "language":
+                lang = item.get("language") if isinstance(item, dict) else None
+                stratum[key] = lang if isinstance(lang, str) else self.detect_lang(messages)
+            elif key == "length_bucket":
+                stratum[key] = self.length_bucket(len(messages))
+            elif key == "has_url":
+                stratum[key] = str(any(
+                    isinstance(m, dict) and isinstance(m.get("content"), str) and URL_PATTERN.search(m["content"])
+                    for m in messages
+                )).lower()
+            elif key == "error_codes":
+                stratum[key] = ",".join(sorted(error_codes.get(index, ()))) or "none"
+            else:
+                raise ValueError(f"Unknown stratify_by key '{key}'; expected one of {', '.join(STRATUM_KEYS)}.")
+        return stratum
+
+    def prior_error_codes(self) -> dict[int, set[str]]:
+        """
+        Map sample index -> error codes reported by earlier validators of the run.
+        The 'prior_errors' option (validator output format) overrides them.
+        """
+        if "prior_errors" not in self.options:
+            return self.context.error_codes if self.context else {}
+        codes: dict[int, set[str]] = {}
+        for err in self.options.get("prior_errors") or []:
+            if isinstance(err, dict) and err.get("index") is not None and err.get("code"):
+                codes.setdefault(int(err["index"]), set()).add(err["code"])
+        return codes
+
+    async def sample(self, samples, total: int | None = None) -> list[dict]:
+        """
+        Select review items from any iterable of samples in a single pass.
+        Returns bundle records ordered by stratum, then sample index.
+        """
+        reservoir = StratifiedReservoir(self.options.get("per_stratum", 5), self.options.get("seed", 42))
+        error_codes = self.prior_error_codes()
+        async for i, item in self.iterate(samples):
+            stratum = self.stratum_of(i, item, error_codes)
+            reservoir.add(tuple(stratum.items()), (i, item))
+            if total:
+                self.report_progress(i + 1, total)
+
+        records = []
+        for stratum, picked in reservoir.items():
+            for i, item in sorted(picked, key=lambda p: p[0]):
+                records.append({"index": i, "stratum": dict(stratum), "sample": item})
+        return records
+
+    @staticmethod
+    def to_jsonl(records: list[dict]) -> str:
+        return "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records)
+
+    async def _validate(self, data: list[dict]) -> list[ValidationErrorDetail]:
+        errors: list[ValidationErrorDetail] = []
+
+        total = len(data) if hasattr(data, "__len__") else None
+        records = await self.sample(data, total)
+        if not records:
+            return errors
+
+        bundle = self.to_jsonl(records)
+        output_path = self.options.get("output_path")
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(bundle)
+
+        # The bundle is an output for the reviewer, not a validation failure
+        self.artifacts["review_bundle"] = bundle
+        self.report_stage(f"selected {len(records)} sample(s) for manual review")
+        return errors
@@ -0,0 +1,73 @@
+"""
+---
+name: Local Validation Runner
+description: Runs validators against a dataset file opened lazily through the memory-mapped loader
+tags: [runner]
+---
+
+Usage (from the repository root):
+  python -m validators.runner DATASET [VALIDATOR_FILE ...] [--options '{"QuantitySizeValidator": {"min_samples": 10}}']
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import inspect
+import json
+from pathlib import Path
+from typing import Any
+from validators.base_validator import BaseValidator, DatasetContext
+from validators.dataset_loader import open_dataset
+
+VALIDATORS_DIR = Path(__file__).parent
+
+
+def load_validator_classes(files: list[str | Path] | None = None) -> list[type[BaseValidator]]:
+    """Validator classes defined in the given files, or in every gate folder when none are given."""
+    paths = [Path(f) for f in files] if files else sorted(VALIDATORS_DIR.glob("gate*/*.py"))
+    classes = []
+    for path in paths:
+        spec = importlib.util.spec_from_file_location("validators_" + path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if issubclass(obj, BaseValidator) and obj is not BaseValidator and obj.__module__ == module.__name__:
+                classes.append(obj)
+    return classes
+
+
+async def run_validators(
+    path: str | Path,
+    files: list[str | Path] | None = None,
+    options: dict[str, dict[str, Any]] | None = None,
+    progress_callback=None,
+) -> list[dict[str, Any]]:
+    """
+    Validate a JSON array / JSONL file. Samples are decoded on demand from the
+    memory-mapped file, and one DatasetContext is shared by all validators, so
+    later gates (e.g. the gate 9 sampler) see the error codes of earlier ones.
+    """
+    options = options or {}
+    results = []
+    with open_dataset(path) as dataset:
+        context = DatasetContext(dataset)
+        for cls in load_validator_classes(files):
+            validator = cls(options=options.get(cls.__name__), progress_callback=progress_callback)
+            results.append(await validator.validate(context))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run dataset validators on a local JSON array or JSONL file.")
+    parser.add_argument("dataset", help="path to a .json (array) or .jsonl file")
+    parser.add_argument("validators", nargs="*", help="validator files to run (default: all gates)")
+    parser.add_argument("--options", default="{}", help="JSON object mapping validator class names to options")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_validators(args.dataset, args.validators, json.loads(args.options)))
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    return 0 if all(r["status"] == "pass" for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())